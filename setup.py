@@ -8,6 +8,7 @@ INSTALL_REQUIRES = [
     "plotly>=5.0.0",      # For plotting in dashboards
     "matplotlib>=3.5.0",  # For plotting square waves in dashboards
     "numpy>=1.22.0",      # For numerical operations in dashboards
+    "orjson>=3.6.0",      # For serializing API requests in remote/
 ]
 
 setup(
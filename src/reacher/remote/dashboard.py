@@ -86,6 +86,17 @@ class Dashboard:
         """
         self.api_config = config
 
+    def get_api_base_url(self) -> str:
+        """Get the base URL of the REACHER API.
+
+        **Description:**
+        - Builds the URL from the configured host and port.
+
+        **Returns:**
+        - `str`: The API base URL, e.g. `http://host:port`.
+        """
+        return f"http://{self.api_config['host']}:{self.api_config['port']}"
+
     def add_response(self, response: str) -> None:
         """Add a response message to the response terminal.
 
@@ -149,10 +160,9 @@ class Dashboard:
         if not self.api_connected:
             self.add_response("Please connect to the API first.")
             return
-        api_config = self.get_api_config()
         try:
             import requests
-            response = requests.post(timeout=5, url=f"http://{api_config['host']}:{api_config['port']}/reset")
+            response = requests.post(timeout=5, url=f"{self.get_api_base_url()}/reset")
             response.raise_for_status()
             response_data = response.json()
             self.add_response(response_data.get('status', 'Session reset.'))
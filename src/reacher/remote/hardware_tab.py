@@ -1,14 +1,55 @@
 import panel as pn
 import matplotlib
-matplotlib.use('Qt5Agg')
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import numpy as np
-from typing import List, Any, Dict
+import logging
+import orjson
+import queue
+import requests
+import threading
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from functools import partial
+from typing import List, Any, Dict, Optional, Tuple
 from .dashboard import Dashboard
 
+_SESSION: requests.Session = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=Retry(total=2, backoff_factor=0.1)))
+_JSON_HEADERS: Dict[str, str] = {'Content-Type': 'application/json'}
+logger = logging.getLogger(__name__)
+
 class HardwareTab(Dashboard):
     """A class to manage the Hardware tab UI for controlling wireless REACHER hardware, inheriting from Dashboard."""
 
+    # Component key -> (state flag, toggle button, arm command, disarm command, error label)
+    _ARM_SPEC: Dict[str, Tuple[str, str, str, str, str]] = {
+        "rh_lever": ("rh_lever_armed", "arm_rh_lever_button", "ARM_LEVER_RH", "DISARM_LEVER_RH", "RH lever"),
+        "lh_lever": ("lh_lever_armed", "arm_lh_lever_button", "ARM_LEVER_LH", "DISARM_LEVER_LH", "LH lever"),
+        "cs": ("cue_armed", "arm_cue_button", "ARM_CS", "DISARM_CS", "CS"),
+        "pump": ("pump_armed", "arm_pump_button", "ARM_PUMP", "DISARM_PUMP", "pump"),
+        "lick_circuit": ("lick_circuit_armed", "arm_lick_circuit_button", "ARM_LICK_CIRCUIT", "DISARM_LICK_CIRCUIT", "lick circuit"),
+        "frames": ("microscope_armed", "arm_microscope_button", "ARM_FRAME", "DISARM_FRAME", "2P"),
+        "laser": ("laser_armed", "arm_laser_button", "ARM_LASER", "DISARM_LASER", "laser"),
+    }
+    # Program hardware name -> component key in _ARM_SPEC
+    _COMPONENT_KEYS: Dict[str, str] = {
+        "LH Lever": "lh_lever",
+        "RH Lever": "rh_lever",
+        "Cue": "cs",
+        "Pump": "pump",
+        "Lick Circuit": "lick_circuit",
+        "Laser": "laser",
+        "Imaging Timestamp Receptor": "frames",
+    }
+    _STIM_MODE_COMMANDS: Dict[str, str] = {
+        "Cycle": "LASER_STIM_MODE_CYCLE",
+        "Active-Press": "LASER_STIM_MODE_ACTIVE-PRESS",
+    }
+    _LASER_DURATION_COMMAND: str = "LASER_DURATION:{}"
+    _LASER_FREQUENCY_COMMAND: str = "LASER_FREQUENCY:{}"
+
     def __init__(self) -> None:
         """Initialize the HardwareTab with inherited Dashboard components and tab-specific UI.
 
@@ -17,14 +58,15 @@ class HardwareTab(Dashboard):
         - Includes a real-time square wave plot for laser stimulation.
         """
         super().__init__()
+        self._cmd_queue: queue.Queue = queue.Queue()
+        self._worker: threading.Thread = threading.Thread(target=self._drain_commands, daemon=True)
+        self._worker.start()
+        if pn.state.curdoc is not None and pn.state.curdoc.session_context is not None:
+            pn.state.on_session_destroyed(self._stop_worker)
+        self._last_sent: Dict[str, Any] = {}
+        self._last_sent_lock: threading.Lock = threading.Lock()
         self.hardware_components: Dict[str, callable] = {
-            "LH Lever": self.arm_lh_lever,
-            "RH Lever": self.arm_rh_lever,
-            "Cue": self.arm_cs,
-            "Pump": self.arm_pump,
-            "Lick Circuit": self.arm_lick_circuit,
-            "Laser": self.arm_laser,
-            "Imaging Timestamp Receptor": self.arm_frames    
+            name: partial(self._toggle, key) for name, key in self._COMPONENT_KEYS.items()
         }
         self.active_lever_button: pn.widgets.MenuButton = pn.widgets.MenuButton(
             name="Active Lever", items=[("LH Lever", "LH Lever"), ("RH Lever", "RH Lever")], button_type="primary"
@@ -37,7 +79,7 @@ class HardwareTab(Dashboard):
             value=False,
             button_type="danger"
         )
-        self.arm_rh_lever_button.param.watch(self.arm_rh_lever, 'value')
+        self.arm_rh_lever_button.param.watch(partial(self._toggle, "rh_lever"), 'value', onlychanged=True)
         self.lh_lever_armed: bool = False
         self.arm_lh_lever_button: pn.widgets.Toggle = pn.widgets.Toggle(
             name="Arm LH Lever",
@@ -45,7 +87,7 @@ class HardwareTab(Dashboard):
             value=False,
             button_type="danger"
         )
-        self.arm_lh_lever_button.param.watch(self.arm_lh_lever, 'value')
+        self.arm_lh_lever_button.param.watch(partial(self._toggle, "lh_lever"), 'value', onlychanged=True)
         self.cue_armed: bool = False
         self.arm_cue_button: pn.widgets.Toggle = pn.widgets.Toggle(
             name="Arm Cue",
@@ -53,7 +95,7 @@ class HardwareTab(Dashboard):
             value=False,
             button_type="danger"
         )
-        self.arm_cue_button.param.watch(self.arm_cs, 'value')
+        self.arm_cue_button.param.watch(partial(self._toggle, "cs"), 'value', onlychanged=True)
         self.send_cue_configuration_button: pn.widgets.Button = pn.widgets.Button(
             name="Send",
             icon="upload",
@@ -81,7 +123,7 @@ class HardwareTab(Dashboard):
             value=False,
             button_type="danger"
         )
-        self.arm_pump_button.param.watch(self.arm_pump, 'value')
+        self.arm_pump_button.param.watch(partial(self._toggle, "pump"), 'value', onlychanged=True)
         self.lick_circuit_armed: bool = False
         self.arm_lick_circuit_button: pn.widgets.Toggle = pn.widgets.Toggle(
             name="Arm Lick Circuit",
@@ -89,7 +131,7 @@ class HardwareTab(Dashboard):
             value=False,
             button_type="danger"
         )
-        self.arm_lick_circuit_button.param.watch(self.arm_lick_circuit, 'value')
+        self.arm_lick_circuit_button.param.watch(partial(self._toggle, "lick_circuit"), 'value', onlychanged=True)
         self.microscope_armed: bool = False
         self.arm_microscope_button: pn.widgets.Toggle = pn.widgets.Toggle(
             name="Arm Scope",
@@ -97,7 +139,7 @@ class HardwareTab(Dashboard):
             value=False,
             button_type="danger"
         )
-        self.arm_microscope_button.param.watch(self.arm_frames, 'value')
+        self.arm_microscope_button.param.watch(partial(self._toggle, "frames"), 'value', onlychanged=True)
         self.laser_armed: bool = False
         self.arm_laser_button: pn.widgets.Toggle = pn.widgets.Toggle(
             name="Arm Laser",
@@ -106,7 +148,7 @@ class HardwareTab(Dashboard):
             icon="lock",
             disabled=False
         )
-        self.arm_laser_button.param.watch(self.arm_laser, 'value')
+        self.arm_laser_button.param.watch(partial(self._toggle, "laser"), 'value', onlychanged=True)
         self.stim_mode_widget: pn.widgets.Select = pn.widgets.Select(
             name="Stim Mode",
             options=["Cycle", "Active-Press"],
@@ -133,232 +175,210 @@ class HardwareTab(Dashboard):
             disabled=False
         )
         self.send_laser_config_button.on_click(self.send_laser_configuration)
+        self._square_wave_t: np.ndarray = np.linspace(0, 1, 1000)
+        self._square_wave_figure: plt.Figure = Figure(figsize=(5, 2))
+        self._square_wave_axes = self._square_wave_figure.add_subplot()
+        self._square_wave_line, = self._square_wave_axes.plot([], [], drawstyle='steps-post')
+        self._square_wave_axes.set_xlabel('Time [s]')
+        self._square_wave_axes.set_ylabel('Amplitude')
+        self._square_wave_axes.set_xlim([0, 1])
+        self._square_wave_axes.set_ylim([-0.1, 1.1])
+        self._square_wave_axes.grid(True)
         self.interactive_plot = pn.bind(
             self.plot_square_wave, 
-            frequency=self.stim_frequency_slider, 
+            frequency=self.stim_frequency_slider.param.value_throttled, 
         )
 
-    def set_active_lever(self, event: Any) -> None:
-        """Set the active lever for the experiment via the API.
+    def set_api_config(self, config: Dict[str, Any]) -> None:
+        """Set the API configuration and forget previously sent settings.
 
         **Description:**
-        - Designates either the left-hand or right-hand lever as active.
+        - Updates the API configuration with provided values.
+        - Clears the record of sent settings, since the new API may drive a different board.
 
         **Args:**
-        - `event (Any)`: The event object containing the new lever selection.
+        - `config (Dict[str, Any])`: Dictionary containing host, port, and key.
         """
-        if not self.api_connected:
-            self.add_response("Please connect to the API first.")
-            return
-        api_config = self.get_api_config()
-        if event.new == "LH Lever":
-            data = {'command': 'ACTIVE_LEVER_LH'}
-        elif event.new == "RH Lever":
-            data = {'command': 'ACTIVE_LEVER_RH'}
-        try:
-            import requests
-            response = requests.post(timeout=5, url=f"http://{api_config['host']}:{api_config['port']}/serial/command", json=data)
-            response.raise_for_status()
-        except Exception as e:
-            self.add_error("Failed to set active lever", str(e))
+        super().set_api_config(config)
+        self.forget_sent_settings()
 
-    def arm_rh_lever(self, _: Any) -> None:
-        """Arm or disarm the right-hand lever via the API.
+    def forget_sent_settings(self, _: Any = None) -> None:
+        """Forget which settings were last sent to the board.
 
         **Description:**
-        - Toggles the arming state of the right-hand lever and updates the UI.
+        - Called when the session is reset or the API or serial connection changes, since the board may be back on its defaults.
+        - The next selection of a setting is sent even if it matches the last one sent.
 
         **Args:**
         - `_ (Any)`: Unused event argument.
         """
-        if not self.api_connected:
-            self.add_response("Please connect to the API first.")
-            return
-        api_config = self.get_api_config()
-        try:
-            import requests
-            if not self.rh_lever_armed:
-                data = {'command': 'ARM_LEVER_RH'}
-                self.rh_lever_armed = True
-                self.arm_rh_lever_button.icon = "unlock"
-            else:
-                data = {'command': 'DISARM_LEVER_RH'}
-                self.rh_lever_armed = False
-                self.arm_rh_lever_button.icon = "lock"
-            response = requests.post(timeout=5, url=f"http://{api_config['host']}:{api_config['port']}/serial/command", json=data)
-            response.raise_for_status()
-        except Exception as e:
-            self.add_error("Failed to arm or disarm RH lever", str(e))
+        with self._last_sent_lock:
+            self._last_sent.clear()
+
+    def _command_url(self) -> str:
+        """Get the URL of the API's serial command endpoint.
 
-    def arm_lh_lever(self, _: Any) -> None:
-        """Arm or disarm the left-hand lever via the API.
+        **Returns:**
+        - `str`: The serial command URL.
+        """
+        return f"{self.get_api_base_url()}/serial/command"
+
+    def _post(self, command: str, error: str, setting: Optional[str] = None) -> None:
+        """Queue a serial command for the background sender.
+
+        **Args:**
+        - `command (str)`: The serial command to transmit.
+        - `error (str)`: The message reported if the command fails.
+        - `setting (Optional[str])`: The `_already_sent` key to forget if the command fails.
+        """
+        self._post_batch([command], error, setting)
+
+    def _post_batch(self, commands: List[str], error: str, setting: Optional[str] = None) -> None:
+        """Queue serial commands to be sent back-to-back by the background sender.
 
         **Description:**
-        - Toggles the arming state of the left-hand lever and updates the UI.
+        - Returns immediately so UI callbacks never wait on the network.
+        - The commands are sent in order; the first failure stops the batch and reports `error`.
 
         **Args:**
-        - `_ (Any)`: Unused event argument.
+        - `commands (List[str])`: The serial commands to transmit.
+        - `error (str)`: The message reported if a command fails.
+        - `setting (Optional[str])`: The `_already_sent` key to forget if a command fails.
         """
-        if not self.api_connected:
-            self.add_response("Please connect to the API first.")
-            return
-        api_config = self.get_api_config()
-        try:
-            import requests
-            if not self.lh_lever_armed:
-                data = {'command': 'ARM_LEVER_LH'}
-                self.lh_lever_armed = True
-                self.arm_lh_lever_button.icon = "unlock"
-            else:
-                data = {'command': 'DISARM_LEVER_LH'}
-                self.lh_lever_armed = False
-                self.arm_lh_lever_button.icon = "lock"
-            response = requests.post(timeout=5, url=f"http://{api_config['host']}:{api_config['port']}/serial/command", json=data)
-            response.raise_for_status()
-        except Exception as e:
-            self.add_error("Failed to arm or disarm LH lever", str(e))
+        self._cmd_queue.put((self._command_url(), commands, error, setting, pn.state.curdoc))
 
-    def arm_cs(self, _: Any) -> None:
-        """Arm or disarm the cue stimulus via the API.
+    def _already_sent(self, setting: str, value: Any) -> bool:
+        """Check whether a setting value was the last one sent, recording it if not.
 
         **Description:**
-        - Toggles the arming state of the cue stimulus and updates the UI.
+        - The record is dropped by `_drain_commands` if sending the value fails, so a retry goes through.
 
         **Args:**
-        - `_ (Any)`: Unused event argument.
+        - `setting (str)`: Name of the setting, e.g. `"active_lever"`.
+        - `value (Any)`: The value about to be sent.
+
+        **Returns:**
+        - `bool`: True if `value` matches the last value sent for `setting`.
         """
-        if not self.api_connected:
-            self.add_response("Please connect to the API first.")
-            return
-        api_config = self.get_api_config()
-        try:
-            import requests
-            if not self.cue_armed:
-                data = {'command': 'ARM_CS'}
-                self.cue_armed = True
-                self.arm_cue_button.icon = "unlock"
-            else:
-                data = {'command': 'DISARM_CS'}
-                self.cue_armed = False
-                self.arm_cue_button.icon = "lock"
-            response = requests.post(timeout=5, url=f"http://{api_config['host']}:{api_config['port']}/serial/command", json=data)
-            response.raise_for_status()
-        except Exception as e:
-            self.add_error("Failed to arm or disarm CS", str(e))
+        with self._last_sent_lock:
+            if self._last_sent.get(setting) == value:
+                return True
+            self._last_sent[setting] = value
+            return False
 
-    def send_cue_configuration(self, _: Any) -> None:
-        """Send cue configuration to the API.
+    def _send(self, url: str, command: str) -> None:
+        """Send a serial command to the API over the pooled session.
 
         **Description:**
-        - Transmits frequency and duration settings for the cue.
+        - Reuses the module-level `requests.Session` so consecutive commands share one keep-alive connection.
 
         **Args:**
-        - `_ (Any)`: Unused event argument.
+        - `url (str)`: The serial command endpoint, resolved when the command was queued.
+        - `command (str)`: The serial command to transmit.
         """
-        if not self.api_connected:
-            self.add_response("Please connect to the API first.")
-            return
-        api_config = self.get_api_config()
-        try:
-            import requests
-            data = {'command': f"SET_FREQUENCY_CS:{self.cue_frequency_intslider.value}"}
-            response = requests.post(timeout=5, url=f"http://{api_config['host']}:{api_config['port']}/serial/command", json=data)
-            response.raise_for_status()
-            data = {'command': f"SET_DURATION_CS:{self.cue_duration_intslider.value}"}
-            response = requests.post(timeout=5, url=f"http://{api_config['host']}:{api_config['port']}/serial/command", json=data)
-            response.raise_for_status()
-        except Exception as e:
-            self.add_error("Failed to send CS configuration", str(e))
-
-    def arm_pump(self, _: Any) -> None:
-        """Arm or disarm the pump via the API.
+        response = _SESSION.post(timeout=5, url=url, data=orjson.dumps({'command': command}), headers=_JSON_HEADERS)
+        response.raise_for_status()
+
+    def _drain_commands(self) -> None:
+        """Send queued serial commands to the API from the background worker thread.
 
         **Description:**
-        - Toggles the arming state of the pump and updates the UI.
+        - Errors are reported on the originating document's next tick, or directly when no document is active.
+        - Failures while reporting are logged so the worker keeps draining the queue.
+        - Exits when `_stop_worker` queues the `None` sentinel.
+        """
+        while True:
+            item = self._cmd_queue.get()
+            if item is None:
+                self._cmd_queue.task_done()
+                return
+            url, commands, error, setting, doc = item
+            try:
+                for command in commands:
+                    self._send(url, command)
+            except Exception as e:
+                if setting is not None:
+                    with self._last_sent_lock:
+                        self._last_sent.pop(setting, None)
+                self._report_error(doc, error, str(e))
+            finally:
+                self._cmd_queue.task_done()
+
+    def _stop_worker(self, session_context: Any) -> None:
+        """Stop the background worker once the commands already queued have been sent.
+
+        **Description:**
+        - Registered with `pn.state.on_session_destroyed` so closed browser sessions do not leave workers behind.
+        - Bokeh requires the callback to take exactly one positional `session_context` argument.
 
         **Args:**
-        - `_ (Any)`: Unused event argument.
+        - `session_context (Any)`: The destroyed session's context, or None when called directly.
+        """
+        self._cmd_queue.put(None)
+
+    def _report_error(self, doc: Any, error: str, details: str) -> None:
+        """Report a failed command from the background worker thread.
+
+        **Args:**
+        - `doc (Any)`: The Bokeh document the command was queued from, or None.
+        - `error (str)`: The error message.
+        - `details (str)`: Additional details about the error.
         """
-        if not self.api_connected:
-            self.add_response("Please connect to the API first.")
-            return
-        api_config = self.get_api_config()
         try:
-            import requests
-            if not self.pump_armed:
-                data = {'command': 'ARM_PUMP'}
-                self.pump_armed = True
-                self.arm_pump_button.icon = "unlock"
+            if doc is not None:
+                doc.add_next_tick_callback(partial(self.add_error, error, details))
             else:
-                data = {'command': 'DISARM_PUMP'}
-                self.pump_armed = False
-                self.arm_pump_button.icon = "lock"
-            response = requests.post(timeout=5, url=f"http://{api_config['host']}:{api_config['port']}/serial/command", json=data)
-            response.raise_for_status()
-        except Exception as e:
-            self.add_error("Failed to arm or disarm pump", str(e))
+                self.add_error(error, details)
+        except Exception:
+            logger.exception("%s: %s", error, details)
 
-    def arm_lick_circuit(self, _: Any) -> None:
-        """Arm or disarm the lick circuit via the API.
+    def set_active_lever(self, event: Any) -> None:
+        """Set the active lever for the experiment via the API.
 
         **Description:**
-        - Toggles the arming state of the lick circuit and updates the UI.
+        - Designates either the left-hand or right-hand lever as active.
+        - Skips the request when the selected lever is already active.
 
         **Args:**
-        - `_ (Any)`: Unused event argument.
+        - `event (Any)`: The event object containing the new lever selection.
         """
         if not self.api_connected:
             self.add_response("Please connect to the API first.")
             return
-        api_config = self.get_api_config()
-        try:
-            import requests
-            if not self.lick_circuit_armed:
-                data = {'command': 'ARM_LICK_CIRCUIT'}
-                self.lick_circuit_armed = True
-                self.arm_lick_circuit_button.icon = "unlock"
-            else:
-                data = {'command': 'DISARM_LICK_CIRCUIT'}
-                self.lick_circuit_armed = False
-                self.arm_lick_circuit_button.icon = "lock"
-            response = requests.post(timeout=5, url=f"http://{api_config['host']}:{api_config['port']}/serial/command", json=data)
-            response.raise_for_status()
-        except Exception as e:
-            self.add_error("Failed to arm or disarm lick circuit", str(e))
+        if event.new == "LH Lever":
+            command = 'ACTIVE_LEVER_LH'
+        elif event.new == "RH Lever":
+            command = 'ACTIVE_LEVER_RH'
+        if self._already_sent("active_lever", event.new):
+            self.add_response(f"{event.new} is already the active lever.")
+            return
+        self._post(command, "Failed to set active lever", "active_lever")
 
-    def arm_frames(self, _: Any) -> None:
-        """Arm or disarm the imaging timestamp receptor via the API.
+    def _toggle(self, key: str, _: Any) -> None:
+        """Arm or disarm a hardware component via the API.
 
         **Description:**
-        - Toggles the arming state of the imaging timestamp receptor and updates the UI.
+        - Looks up the component's state flag, button, and commands in `_ARM_SPEC`.
+        - Toggles the arming state and updates the UI.
 
         **Args:**
+        - `key (str)`: The component key in `_ARM_SPEC`.
         - `_ (Any)`: Unused event argument.
         """
         if not self.api_connected:
             self.add_response("Please connect to the API first.")
             return
-        api_config = self.get_api_config()
-        try:
-            import requests
-            if not self.microscope_armed:
-                data = {'command': 'ARM_FRAME'}
-                self.microscope_armed = True
-                self.arm_microscope_button.icon = "unlock"
-            else:
-                data = {'command': 'DISARM_FRAME'}
-                self.microscope_armed = False
-                self.arm_microscope_button.icon = "lock"
-            response = requests.post(timeout=5, url=f"http://{api_config['host']}:{api_config['port']}/serial/command", json=data)
-            response.raise_for_status()
-        except Exception as e:
-            self.add_error("Failed to arm or disarm 2P", str(e))
+        flag_attr, button_attr, arm_command, disarm_command, label = self._ARM_SPEC[key]
+        armed = getattr(self, flag_attr)
+        setattr(self, flag_attr, not armed)
+        getattr(self, button_attr).icon = "lock" if armed else "unlock"
+        self._post(disarm_command if armed else arm_command, f"Failed to arm or disarm {label}")
 
-    def arm_laser(self, _: Any) -> None:
-        """Arm or disarm the laser via the API.
+    def send_cue_configuration(self, _: Any) -> None:
+        """Send cue configuration to the API.
 
         **Description:**
-        - Toggles the arming state of the laser and updates the UI.
+        - Transmits frequency and duration settings for the cue.
 
         **Args:**
         - `_ (Any)`: Unused event argument.
@@ -366,21 +386,10 @@ class HardwareTab(Dashboard):
         if not self.api_connected:
             self.add_response("Please connect to the API first.")
             return
-        api_config = self.get_api_config()
-        try:
-            import requests
-            if not self.laser_armed:
-                data = {'command': 'ARM_LASER'}
-                self.laser_armed = True
-                self.arm_laser_button.icon = "unlock"
-            else:
-                data = {'command': 'DISARM_LASER'}
-                self.laser_armed = False
-                self.arm_laser_button.icon = "lock"
-            response = requests.post(timeout=5, url=f"http://{api_config['host']}:{api_config['port']}/serial/command", json=data)
-            response.raise_for_status()
-        except Exception as e:
-            self.add_error("Failed to arm or disarm laser", str(e))
+        self._post_batch([
+            f"SET_FREQUENCY_CS:{self.cue_frequency_intslider.value}",
+            f"SET_DURATION_CS:{self.cue_duration_intslider.value}"
+        ], "Failed to send CS configuration")
 
     def send_laser_configuration(self, _: Any) -> None:
         """Send laser configuration to the API.
@@ -394,26 +403,19 @@ class HardwareTab(Dashboard):
         if not self.api_connected:
             self.add_response("Please connect to the API first.")
             return
-        api_config = self.get_api_config()
-        try:
-            import requests
-            data = {'command': f"LASER_STIM_MODE_{str(self.stim_mode_widget.value).upper()}"}
-            response = requests.post(timeout=5, url=f"http://{api_config['host']}:{api_config['port']}/serial/command", json=data)
-            response.raise_for_status()
-            data = {'command': f"LASER_DURATION:{str(self.stim_duration_slider.value)}"}
-            response = requests.post(timeout=5, url=f"http://{api_config['host']}:{api_config['port']}/serial/command", json=data)
-            response.raise_for_status()
-            data = {'command': f"LASER_FREQUENCY:{str(self.stim_frequency_slider.value)}"}
-            response = requests.post(timeout=5, url=f"http://{api_config['host']}:{api_config['port']}/serial/command", json=data)
-            response.raise_for_status()
-        except Exception as e:
-            self.add_error("Failed to send laser configuration", str(e))
+        self._post_batch([
+            self._STIM_MODE_COMMANDS[self.stim_mode_widget.value],
+            self._LASER_DURATION_COMMAND.format(self.stim_duration_slider.value),
+            self._LASER_FREQUENCY_COMMAND.format(self.stim_frequency_slider.value)
+        ], "Failed to send laser configuration")
 
     def plot_square_wave(self, frequency: int) -> plt.Figure:
         """Plot a square wave for one second based on the given frequency.
 
         **Description:**
         - Generates a visual representation of a square wave for laser stimulation.
+        - Updates the line on the cached figure rather than building a new figure on every change.
+        - Draws only the rising and falling edges of the wave as a step line.
 
         **Args:**
         - `frequency (int)`: Number of pulses per second.
@@ -421,24 +423,14 @@ class HardwareTab(Dashboard):
         **Returns:**
         - `plt.Figure`: The matplotlib figure object.
         """
-        total_duration = 1
-        t = np.linspace(0, total_duration, 1000)
-        square_wave = np.zeros_like(t)
-        if frequency == 1:
-            square_wave[1:999] = 1
-        else:
-            period = 1 / frequency
-            for i, time_point in enumerate(t):
-                if (time_point % period) < (period / 2):
-                    square_wave[i] = 1
-        plt.figure(figsize=(5, 2))
-        plt.plot(t, square_wave, drawstyle='steps-pre')
-        plt.title(f'Square Wave - {frequency} Hz')
-        plt.xlabel('Time [s]')
-        plt.ylabel('Amplitude')
-        plt.ylim([-0.1, 1.1])
-        plt.grid(True)
-        return plt.gcf()
+        t = self._square_wave_t
+        period = 1 / frequency
+        square_wave = ((t % period) < (period * 0.5)).view(np.uint8)
+        edges = np.flatnonzero(np.diff(square_wave)) + 1
+        vertices = np.concatenate(([0], edges, [t.size - 1]))
+        self._square_wave_line.set_data(t[vertices], square_wave[vertices])
+        self._square_wave_axes.set_title(f'Square Wave - {frequency} Hz')
+        return self._square_wave_figure
 
     def arm_devices(self, devices: List[str]) -> None:
         """Arm the specified devices via the API.
@@ -449,8 +441,7 @@ class HardwareTab(Dashboard):
         **Args:**
         - `devices (List[str])`: List of device names to arm.
         """
-        for device in devices:
-            arm_device = self.hardware_components.get(device)
+        for arm_device in map(self.hardware_components.get, devices):
             if arm_device:
                 arm_device(None)
 
@@ -129,7 +129,7 @@ class HomeTab(Dashboard):
             return
         try:
             import requests
-            response = requests.get(timeout=5, url=f"http://{api_config['host']}:{api_config['port']}/connection")
+            response = requests.get(timeout=5, url=f"{self.get_api_base_url()}/connection")
             response.raise_for_status()
             response_data = response.json()
             if response_data.get('connected'):
@@ -153,10 +153,9 @@ class HomeTab(Dashboard):
             self.add_response("Please connect to the API first.")
             return
         self.add_response("Searching for microcontrollers...")
-        api_config = self.get_api_config()
         try:
             import requests
-            response = requests.get(timeout=5, url=f"http://{api_config['host']}:{api_config['port']}/serial/comports")
+            response = requests.get(timeout=5, url=f"{self.get_api_base_url()}/serial/comports")
             response_data = response.json()
             ports = response_data.get('ports', [])
             self.add_response(response_data.get('status', 'Ports retrieved'))
@@ -180,17 +179,16 @@ class HomeTab(Dashboard):
         if not self.api_connected:
             self.add_response("Please connect to the API first.")
             return
-        api_config = self.get_api_config()
         port = self.microcontroller_menu.value
         if not port:
             self.add_response("Please select a microcontroller.")
             return
         try:
             import requests
-            response = requests.post(timeout=5, url=f"http://{api_config['host']}:{api_config['port']}/serial/port", json={'port': port})
+            response = requests.post(timeout=5, url=f"{self.get_api_base_url()}/serial/port", json={'port': port})
             response.raise_for_status()
             self.add_response(response.json().get('status', f'COM port set to {port}'))
-            response = requests.post(timeout=5, url=f"http://{api_config['host']}:{api_config['port']}/serial/transmission")
+            response = requests.post(timeout=5, url=f"{self.get_api_base_url()}/serial/transmission")
             response.raise_for_status()
             self.add_response(response.json().get('status', 'Serial connection opened'))
         except Exception as e:
@@ -208,10 +206,9 @@ class HomeTab(Dashboard):
         if not self.api_connected:
             self.add_response("Not connected to API.")
             return
-        api_config = self.get_api_config()
         try:
             import requests
-            response = requests.post(timeout=5, url=f"http://{api_config['host']}:{api_config['port']}/serial/termination")
+            response = requests.post(timeout=5, url=f"{self.get_api_base_url()}/serial/termination")
             response.raise_for_status()
             self.add_response(response.json().get('status', 'Serial connection closed'))
         except Exception as e:
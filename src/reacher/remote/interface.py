@@ -17,6 +17,7 @@ class Interface(Dashboard):
         - Extends Dashboard to create and organize all tab components.
         - Sets up the tabbed interface with Home, Program, Hardware, Monitor, and Schedule tabs.
         - Links MonitorTab with ProgramTab and HardwareTab for inter-tab dependencies.
+        - Clears HardwareTab's record of sent settings on session resets and API or serial reconnects.
         """
         super().__init__()
         self.home_tab: HomeTab = HomeTab()
@@ -26,6 +27,13 @@ class Interface(Dashboard):
         self.schedule_tab: ScheduleTab = ScheduleTab()
         self.monitor_tab.program_tab = self.program_tab
         self.monitor_tab.hardware_tab = self.hardware_tab
+        for button in (
+            self.reset_button,
+            self.home_tab.verify_connection_button,
+            self.home_tab.serial_connect_button,
+            self.home_tab.serial_disconnect_button,
+        ):
+            button.on_click(self.hardware_tab.forget_sent_settings)
         self.tabs: pn.Tabs = pn.Tabs(
             ("Home", self.home_tab.layout()),
             ("Program", self.program_tab.layout()),
@@ -55,10 +55,9 @@ class MonitorTab(Dashboard):
         """
         if not self.api_connected:
             return pd.DataFrame()
-        api_config = self.get_api_config()
         try:
             import requests
-            response = requests.get(timeout=5, url=f"http://{api_config['host']}:{api_config['port']}/processor/behavior_data")
+            response = requests.get(timeout=5, url=f"{self.get_api_base_url()}/processor/behavior_data")
             response.raise_for_status()
             data = response.json().get('data', [])
             self.add_response(response.json().get('status', 'Data fetched'))
@@ -126,10 +125,9 @@ class MonitorTab(Dashboard):
         """
         if not self.api_connected:
             return
-        api_config = self.get_api_config()
         try:
             import requests
-            response = requests.get(timeout=5, url=f"http://{api_config['host']}:{api_config['port']}/program/activity")
+            response = requests.get(timeout=5, url=f"{self.get_api_base_url()}/program/activity")
             is_active = response.json().get('activity', False)
             self.add_response(response.json().get('status', 'Activity checked'))
             if not is_active and self.periodic_callback:
@@ -165,10 +163,9 @@ class MonitorTab(Dashboard):
         if self.program_tab is None or self.hardware_tab is None:
             self.add_error("Dependencies not set", "ProgramTab or HardwareTab not initialized.")
             return
-        api_config = self.get_api_config()
         try:
             import requests
-            response = requests.post(timeout=5, url=f"http://{api_config['host']}:{api_config['port']}/program/start")
+            response = requests.post(timeout=5, url=f"{self.get_api_base_url()}/program/start")
             response.raise_for_status()
             self.add_response(response.json().get('status', 'Program started'))
             if pn.state.curdoc and not self.periodic_callback:
@@ -194,10 +191,9 @@ class MonitorTab(Dashboard):
         if not self.api_connected:
             self.add_response("Please connect to the API first.")
             return
-        api_config = self.get_api_config()
         try:
             import requests
-            response = requests.post(timeout=5, url=f"http://{api_config['host']}:{api_config['port']}/program/interim")
+            response = requests.post(timeout=5, url=f"{self.get_api_base_url()}/program/interim")
             response.raise_for_status()
             data = response.json()
             if data.get('state'):
@@ -224,10 +220,9 @@ class MonitorTab(Dashboard):
         if not self.api_connected:
             self.add_response("Please connect to the API first.")
             return
-        api_config = self.get_api_config()
         try:
             import requests
-            response = requests.post(timeout=5, url=f"http://{api_config['host']}:{api_config['port']}/program/end")
+            response = requests.post(timeout=5, url=f"{self.get_api_base_url()}/program/end")
             response.raise_for_status()
             self.add_response(response.json().get('status', 'Program stopped'))
             if self.periodic_callback:
@@ -253,15 +248,14 @@ class MonitorTab(Dashboard):
         if not self.api_connected:
             self.add_response("Please connect to the API first.")
             return
-        api_config = self.get_api_config()
         try:
             import requests
             responses = {
-                'start_time': requests.get(timeout=5, url=f"http://{api_config['host']}:{api_config['port']}/program/start_time"),
-                'end_time': requests.get(timeout=5, url=f"http://{api_config['host']}:{api_config['port']}/program/end_time"),
-                'arduino_configuration': requests.get(timeout=5, url=f"http://{api_config['host']}:{api_config['port']}/processor/arduino_configuration"),
-                'data': requests.get(timeout=5, url=f"http://{api_config['host']}:{api_config['port']}/processor/data"),
-                'filename': requests.get(timeout=5, url=f"http://{api_config['host']}:{api_config['port']}/file/filename"),
+                'start_time': requests.get(timeout=5, url=f"{self.get_api_base_url()}/program/start_time"),
+                'end_time': requests.get(timeout=5, url=f"{self.get_api_base_url()}/program/end_time"),
+                'arduino_configuration': requests.get(timeout=5, url=f"{self.get_api_base_url()}/processor/arduino_configuration"),
+                'data': requests.get(timeout=5, url=f"{self.get_api_base_url()}/processor/data"),
+                'filename': requests.get(timeout=5, url=f"{self.get_api_base_url()}/file/filename"),
             }
             for key, resp in responses.items():
                 resp.raise_for_status()
@@ -85,7 +85,6 @@ class ProgramTab(Dashboard):
         if not self.api_connected:
             self.add_response("Please connect to the API first.")
             return
-        api_config = self.get_api_config()
         data = {
             'type': self.limit_type_radiobutton.value,
             'infusion_limit': self.infusion_limit_intslider.value,
@@ -99,7 +98,7 @@ class ProgramTab(Dashboard):
             if preset_func and self.presets_menubutton.value != "Custom":
                 preset_func()
             import requests
-            response = requests.post(timeout=5, url=f"http://{api_config['host']}:{api_config['port']}/program/limit", json=data)
+            response = requests.post(timeout=5, url=f"{self.get_api_base_url()}/program/limit", json=data)
             response.raise_for_status()
             self.add_response(response.json().get('status', 'Limits set successfully'))
         except Exception as e:
@@ -117,14 +116,13 @@ class ProgramTab(Dashboard):
         if not self.api_connected:
             self.add_response("Please connect to the API first.")
             return
-        api_config = self.get_api_config()
         try:
             import requests
-            response = requests.post(timeout=5, url=f"http://{api_config['host']}:{api_config['port']}/file/filename", 
+            response = requests.post(timeout=5, url=f"{self.get_api_base_url()}/file/filename", 
                                     json={'name': self.filename_textinput.value})
             response.raise_for_status()
             self.add_response(response.json().get('status', 'Filename set'))
-            response = requests.post(timeout=5, url=f"http://{api_config['host']}:{api_config['port']}/file/destination", 
+            response = requests.post(timeout=5, url=f"{self.get_api_base_url()}/file/destination", 
                                     json={'destination': self.file_destination_textinput.value})
             response.raise_for_status()
             self.add_response(response.json().get('status', 'Destination set'))
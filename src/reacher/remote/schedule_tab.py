@@ -47,10 +47,9 @@ class ScheduleTab(Dashboard):
         if not self.api_connected:
             self.add_response("Please connect to the API first.")
             return
-        api_config = self.get_api_config()
         try:
             import requests
-            response = requests.post(timeout=5, url=f"http://{api_config['host']}:{api_config['port']}/serial/command", 
+            response = requests.post(timeout=5, url=f"{self.get_api_base_url()}/serial/command", 
                                     json={'command': f"{command}:{value}"})
             response.raise_for_status()
             self.add_response(response.json().get('status', f"{command} set to {value}"))
@@ -0,0 +1,79 @@
+import pytest
+import requests
+from bokeh.document import Document
+from panel.io.state import set_curdoc
+from reacher.remote.hardware_tab import HardwareTab
+from unittest.mock import Mock, PropertyMock
+
+@pytest.fixture
+def hardware_tab():
+    tab = HardwareTab()
+    yield tab
+    tab._stop_worker(None)
+    tab._worker.join(timeout=5)
+
+def test_hardware_tab_init_with_session(mocker):
+    doc = Document()
+    mocker.patch.object(Document, "session_context", new_callable=PropertyMock, return_value=Mock())
+    with set_curdoc(doc):
+        tab = HardwareTab()
+    assert tab._worker.is_alive()
+    assert tab._stop_worker in doc.session_destroyed_callbacks
+    for callback in doc.session_destroyed_callbacks:
+        callback(Mock())
+    tab._worker.join(timeout=5)
+    assert not tab._worker.is_alive()
+
+def test_drain_commands_reports_failure_and_continues(hardware_tab, mocker):
+    send = mocker.patch.object(hardware_tab, "_send", side_effect=[None, requests.ConnectionError("Connection refused"), None])
+    mocker.patch.object(hardware_tab, "add_error")
+    hardware_tab._post_batch(["SET_FREQUENCY_CS:8000", "SET_DURATION_CS:1600", "UNSENT"], "Failed to send CS configuration")
+    hardware_tab._post("ARM_PUMP", "Failed to arm or disarm pump")
+    hardware_tab._cmd_queue.join()
+    assert [c.args[1] for c in send.call_args_list] == ["SET_FREQUENCY_CS:8000", "SET_DURATION_CS:1600", "ARM_PUMP"]
+    hardware_tab.add_error.assert_called_once_with("Failed to send CS configuration", "Connection refused")
+
+def test_drain_commands_survives_error_reporting_failure(hardware_tab, mocker):
+    send = mocker.patch.object(hardware_tab, "_send", side_effect=[requests.ConnectionError("Connection refused"), None])
+    mocker.patch.object(hardware_tab, "add_error", side_effect=RuntimeError("Document closed"))
+    hardware_tab._post("ARM_PUMP", "Failed to arm or disarm pump")
+    hardware_tab._post("ARM_CS", "Failed to arm or disarm CS")
+    hardware_tab._cmd_queue.join()
+    assert send.call_count == 2
+    assert hardware_tab._worker.is_alive()
+
+def test_stop_worker_sends_queued_commands_first(hardware_tab, mocker):
+    send = mocker.patch.object(hardware_tab, "_send")
+    hardware_tab._post("ARM_PUMP", "Failed to arm or disarm pump")
+    hardware_tab._stop_worker(None)
+    hardware_tab._worker.join(timeout=5)
+    assert not hardware_tab._worker.is_alive()
+    send.assert_called_once_with(hardware_tab._command_url(), "ARM_PUMP")
+
+def test_set_active_lever_skips_repeat_until_forgotten(hardware_tab, mocker):
+    post = mocker.patch.object(hardware_tab, "_post")
+    mocker.patch.object(hardware_tab, "add_response")
+    hardware_tab.api_connected = True
+    hardware_tab.set_active_lever(Mock(new="LH Lever"))
+    hardware_tab.set_active_lever(Mock(new="LH Lever"))
+    post.assert_called_once_with("ACTIVE_LEVER_LH", "Failed to set active lever", "active_lever")
+    hardware_tab.add_response.assert_called_once_with("LH Lever is already the active lever.")
+    hardware_tab.forget_sent_settings()
+    hardware_tab.set_active_lever(Mock(new="LH Lever"))
+    assert post.call_count == 2
+
+def test_interface_buttons_forget_sent_settings(mocker):
+    from reacher.remote.interface import Interface
+    mocker.patch("reacher.remote.dashboard.Dashboard.add_response")
+    mocker.patch("reacher.remote.dashboard.Dashboard.add_error")
+    interface = Interface("Chamber 1")
+    for button in (
+        interface.reset_button,
+        interface.home_tab.verify_connection_button,
+        interface.home_tab.serial_connect_button,
+        interface.home_tab.serial_disconnect_button,
+    ):
+        interface.hardware_tab._last_sent["active_lever"] = "LH Lever"
+        button.clicks += 1
+        assert interface.hardware_tab._last_sent == {}
+    interface.hardware_tab._stop_worker(None)